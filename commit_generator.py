@@ -4,28 +4,183 @@ Simple Git Commit Generator using Ollama LLM
 Analyzes git changes and generates commit message suggestions using llama3.2
 """
 
+import hashlib
 import json
-import os
-import sys
+import sqlite3
 import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
-try:
-    import requests
-    from git import Repo, InvalidGitRepositoryError
-except ImportError as e:
-    print(f"ERROR: Missing dependency: {e}")
+
+def _missing_dependency(error):
+    """Report a missing third-party dependency and exit."""
+    print(f"ERROR: Missing dependency: {error}")
     print("Please install requirements: pip install -r requirements.txt")
     sys.exit(1)
 
 
+def _load_requests():
+    """Import requests on first use so startup doesn't pay for it."""
+    try:
+        import requests
+    except ImportError as e:
+        _missing_dependency(e)
+    return requests
+
+
+# orjson is optional; fall back to the stdlib codec when it's missing
+try:
+    import orjson
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    
+    _json_loads = json.loads
+
+
+# Bump whenever the prompt changes so cached suggestions are not reused
+PROMPT_VERSION = 3
+
+# On-disk cache of suggestions keyed by staged diff, model and prompt version
+CACHE_PATH = Path.home() / ".cache" / "git-commit-gen" / "suggestions.sqlite"
+CACHE_MAX_AGE_DAYS = 7
+CACHE_MAX_ENTRIES = 500
+
+
+# Sampling temperatures for the first and the background "different" pass
+DEFAULT_TEMPERATURE = 0.7
+ALTERNATE_TEMPERATURE = 1.0
+
+# Conventional commit types accepted from the LLM
+_COMMIT_TYPES = frozenset((
+    "feat", "fix", "docs", "style", "refactor", "test", "chore", "perf", "ci", "build", "revert"
+))
+
+# Returned by display_suggestions when the user asks for different suggestions
+REGENERATE = object()
+
+# Number of suggestions requested from the LLM and shown to the user
+SUGGESTION_COUNT = 5
+
+# Generation budget: up to ~40 tokens per quoted message plus the JSON wrapper
+SUGGESTION_TOKENS = SUGGESTION_COUNT * 40 + 20
+
+# Bound the size of the changes summary sent to the LLM
+# (~4 characters per token, so roughly 1500 tokens)
+MAX_SUMMARY_FILES = 20
+MAX_PROMPT_CHARS = 6000
+
+
+# Static prompt text around the git changes summary
+_PROMPT_PREFIX = """IMPORTANT: Look at these changes and determine the ONE correct commit type, then generate %d variations of THE SAME TYPE.
+
+""" % SUGGESTION_COUNT
+
+_PROMPT_SUFFIX = """
+
+CRITICAL RULES:
+1. If ONLY documentation files changed (README, .md files, comments) → ALL suggestions must be 'docs:'
+2. If ONLY code functionality was added → ALL suggestions must be 'feat:'  
+3. If ONLY bugs were fixed → ALL suggestions must be 'fix:'
+4. If ONLY code was cleaned up → ALL suggestions must be 'refactor:'
+5. If ONLY styling/formatting → ALL suggestions must be 'style:'
+
+DO NOT MIX TYPES! All suggestions must use the SAME commit type.
+
+Format: type(scope): description
+Keep descriptions under 50 characters.
+Only vary the descriptions, NEVER the commit type.
+
+Respond with a JSON object of the form {"suggestions": [...]} holding exactly %d commit messages.
+
+WRONG suggestions:
+"The correct type is docs because..."
+"fix: improve performance" (mixed with docs suggestions)
+
+CORRECT response:
+{"suggestions": ["docs: update README with version info", "docs: add version number to documentation", "docs: enhance README header section", "docs: improve README content structure", "docs: clarify README setup steps"]}""" % SUGGESTION_COUNT
+
+# Structured output schema: Ollama constrains decoding to exactly this shape,
+# so the response needs no line filtering
+_SUGGESTIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "suggestions": {
+            "type": "array",
+            "items": {"type": "string"},
+            "minItems": SUGGESTION_COUNT,
+            "maxItems": SUGGESTION_COUNT
+        }
+    },
+    "required": ["suggestions"]
+}
+
+# Request options shared by every suggestion request
+_PAYLOAD_TEMPLATE = {
+    "stream": False,
+    "format": _SUGGESTIONS_SCHEMA,
+    "options": {
+        "temperature": DEFAULT_TEMPERATURE,
+        "top_p": 0.9,
+        # A truncated JSON object can't be parsed, so leave headroom
+        "num_predict": SUGGESTION_TOKENS,
+        "num_ctx": 2048
+    }
+}
+
+
+def _iter_commit_messages(items):
+    """Yield cleaned items whose prefix is a known conventional commit type."""
+    for item in items:
+        if not isinstance(item, str):
+            continue
+        message = item.strip()
+        if message.split(':', 1)[0].split('(', 1)[0].strip().lower() in _COMMIT_TYPES:
+            yield message
+
+
 class SimpleCommitGenerator:
     def __init__(self):
-        self.ollama_url = "http://localhost:11434/api/generate"
+        self.ollama_base_url = "http://localhost:11434"
+        self.ollama_url = f"{self.ollama_base_url}/api/generate"
         self.llm_model = "llama3.2:latest"
         
+        self._http = None
+        # Staged changes collected for this run, reused by retry paths
+        self._changes_summary = None
+    
+    @property
+    def http(self):
+        """Keep-alive session for all Ollama traffic, created on first use."""
+        if self._http is None:
+            requests = _load_requests()
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            self._http = requests.Session()
+            self._http.headers.update({"Connection": "keep-alive"})
+            # Ollama is local: skip the per-request proxy/.netrc environment lookups
+            self._http.trust_env = False
+            retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+            self._http.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retries))
+        return self._http
+        
     def check_git_repo(self):
         """Check if we're in a git repository."""
+        try:
+            from git import Repo, InvalidGitRepositoryError
+        except ImportError as e:
+            _missing_dependency(e)
+        
         try:
             self.repo = Repo(".")
             return True
@@ -37,80 +192,117 @@ class SimpleCommitGenerator:
     def get_git_changes(self):
         """Get staged git changes as a formatted string."""
         try:
-            # Check if there are staged changes
-            try:
-                self.repo.head.commit
-                # Repository has commits, compare against HEAD
-                staged_changes = self.repo.index.diff("HEAD", cached=True)
-            except ValueError:
-                # No commits yet, check staged files directly
-                staged_changes = self.repo.index.diff(None, cached=True)
-            
-            if not staged_changes:
-                print("ERROR: No staged changes found!")
-                print("Please stage some changes first: git add <files>")
-                return None
-            
-            # Get detailed diff information
-            changes_summary = []
-            total_additions = 0
-            total_deletions = 0
-            
-            for change in staged_changes:
-                file_path = change.a_path or change.b_path
-                change_type = change.change_type
-                
-                # Try to get line counts
-                try:
-                    diff_text = change.diff.decode('utf-8', errors='ignore')
-                    additions = len([line for line in diff_text.split('\n') if line.startswith('+')])
-                    deletions = len([line for line in diff_text.split('\n') if line.startswith('-')])
-                    total_additions += additions
-                    total_deletions += deletions
-                except:
-                    additions = deletions = 0
-                
-                changes_summary.append({
-                    'file': file_path,
-                    'type': change_type,
-                    'additions': additions,
-                    'deletions': deletions
-                })
-            
-            # Format changes for LLM
-            summary_text = f"Git Changes Summary:\n"
-            summary_text += f"Total files changed: {len(changes_summary)}\n"
-            summary_text += f"Total additions: {total_additions} lines\n"
-            summary_text += f"Total deletions: {total_deletions} lines\n\n"
-            summary_text += "Files changed:\n"
-            
-            for change in changes_summary:
-                summary_text += f"- {change['file']} ({change['type']}) +{change['additions']} -{change['deletions']}\n"
-            
-            return summary_text
-            
+            changes_summary = self._collect_diff_only()
         except Exception as e:
             print(f"ERROR: Error getting git changes: {e}")
             return None
+        
+        return self._format_git_changes(changes_summary)
+    
+    def _collect_diff_only(self):
+        """Collect per-file line counts for staged changes (read-only, thread-safe)."""
+        if self._changes_summary is not None:
+            return self._changes_summary
+        
+        # git computes the counts in C; we only split the NUL-delimited records
+        numstat = self._run_git("diff", "--cached", "--numstat", "-z", "--no-renames")
+        name_status = self._run_git("diff", "--cached", "--name-status", "-z", "--no-renames")
+        
+        # name-status records alternate: <status>\0<path>\0
+        fields = name_status.split(b'\0')
+        # Keyed by raw path bytes so only the numstat paths get decoded
+        change_types = {
+            path: status[:1].decode('ascii', errors='replace')
+            for status, path in zip(fields[0::2], fields[1::2])
+            if path
+        }
+        
+        changes_summary = []
+        
+        for record in numstat.split(b'\0'):
+            if not record:
+                continue
+            
+            # Binary files report '-' instead of line counts
+            added, deleted, path = record.split(b'\t', 2)
+            
+            changes_summary.append({
+                'file': path.decode('utf-8', errors='replace'),
+                'type': change_types.get(path, 'M'),
+                'additions': int(added) if added.isdigit() else 0,
+                'deletions': int(deleted) if deleted.isdigit() else 0
+            })
+        
+        self._changes_summary = changes_summary
+        return changes_summary
+    
+    def _run_git(self, *args, input=None):
+        """Run a git command in the repository and return its raw stdout."""
+        result = subprocess.run(
+            ["git", *args],
+            input=input,
+            capture_output=True,
+            check=True,
+            cwd=self.repo.working_tree_dir
+        )
+        return result.stdout
+    
+    def _format_git_changes(self, changes_summary):
+        """Format collected changes for the LLM."""
+        if not changes_summary:
+            print("ERROR: No staged changes found!")
+            print("Please stage some changes first: git add <files>")
+            return None
+        
+        total_additions = sum(change['additions'] for change in changes_summary)
+        total_deletions = sum(change['deletions'] for change in changes_summary)
+        
+        summary_text = f"Git Changes Summary:\n"
+        summary_text += f"Total files changed: {len(changes_summary)}\n"
+        summary_text += f"Total additions: {total_additions} lines\n"
+        summary_text += f"Total deletions: {total_deletions} lines\n"
+        totals_text = summary_text
+        summary_text += "\nFiles changed:\n"
+        
+        # Prefill cost grows with prompt size, so list only the largest changes
+        largest_first = sorted(
+            changes_summary,
+            key=lambda change: change['additions'] + change['deletions'],
+            reverse=True
+        )
+        shown, hidden = largest_first[:MAX_SUMMARY_FILES], largest_first[MAX_SUMMARY_FILES:]
+        
+        for change in shown:
+            summary_text += f"- {change['file']} ({change['type']}) +{change['additions']} -{change['deletions']}\n"
+        
+        if hidden:
+            hidden_additions = sum(change['additions'] for change in hidden)
+            hidden_deletions = sum(change['deletions'] for change in hidden)
+            summary_text += f"...and {len(hidden)} more files (+{hidden_additions} -{hidden_deletions})\n"
+        
+        # Very long paths can still blow the budget; fall back to totals only
+        if len(summary_text) > MAX_PROMPT_CHARS:
+            return totals_text
+        
+        return summary_text
     
     def check_ollama_connection(self):
         """Check if Ollama is running and has the model."""
+        requests = _load_requests()
         try:
-            # Check if Ollama is running
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
+            # /api/show only describes our model, so it's cheaper than listing
+            # every installed model via /api/tags
+            response = self.http.post(
+                f"{self.ollama_base_url}/api/show",
+                json={"name": self.llm_model},
+                timeout=5
+            )
             if response.status_code != 200:
-                return False
-                
-            # Check if our model is available
-            models = response.json().get('models', [])
-            model_names = [model['name'] for model in models]
-            
-            if self.llm_model not in model_names:
                 print(f"ERROR: Model {self.llm_model} not found!")
-                print("Available models:", model_names)
                 print(f"Please install the model: ollama pull {self.llm_model}")
                 return False
-                
+            
+            self._warm_up_model()
             return True
             
         except requests.exceptions.ConnectionError:
@@ -121,83 +313,42 @@ class SimpleCommitGenerator:
             print(f"ERROR: Error checking Ollama: {e}")
             return False
     
+    def _warm_up_model(self):
+        """Ask Ollama to load the model in the background (fire-and-forget)."""
+        payload = {
+            "model": self.llm_model,
+            "prompt": " ",
+            "stream": False,
+            "keep_alive": "10m",
+            "options": {"num_predict": 1}
+        }
+        
+        def warm_up():
+            try:
+                self.http.post(self.ollama_url, json=payload, timeout=60)
+            except Exception:
+                # Warm-up is best effort; the real request reports errors
+                pass
+        
+        threading.Thread(target=warm_up, daemon=True).start()
+    
     def get_commit_suggestions(self, git_changes):
         """Get focused commit message suggestions from LLM."""
-        prompt = f"""IMPORTANT: Look at these changes and determine the ONE correct commit type, then generate 3-4 variations of THE SAME TYPE.
-
-{git_changes}
-
-CRITICAL RULES:
-1. If ONLY documentation files changed (README, .md files, comments) → ALL suggestions must be 'docs:'
-2. If ONLY code functionality was added → ALL suggestions must be 'feat:'  
-3. If ONLY bugs were fixed → ALL suggestions must be 'fix:'
-4. If ONLY code was cleaned up → ALL suggestions must be 'refactor:'
-5. If ONLY styling/formatting → ALL suggestions must be 'style:'
-
-DO NOT MIX TYPES! All suggestions must use the SAME commit type.
-
-Format: type(scope): description
-Keep descriptions under 50 characters.
-Only vary the descriptions, NEVER the commit type.
-
-RESPOND WITH ONLY COMMIT MESSAGES - NO EXPLANATIONS OR EXTRA TEXT!
-
-WRONG format:
-The correct type is docs because...
-docs: update readme
-fix: improve performance
-
-CORRECT format:
-docs: update README with version info
-docs: add version number to documentation  
-docs: enhance README header section
-docs: improve README content structure"""
-
+        cache_key = self._suggestions_cache_key(git_changes)
+        cached = self._load_cached_suggestions(cache_key)
+        if cached:
+            print("Using cached suggestions for these staged changes")
+            return cached
+        
+        requests = _load_requests()
         try:
             print("Analyzing changes and generating focused suggestions...")
             
-            payload = {
-                "model": self.llm_model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "top_p": 0.9,
-                    "max_tokens": 300
-                }
-            }
-            
-            response = requests.post(
-                self.ollama_url, 
-                json=payload, 
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                print(f"ERROR: LLM request failed: {response.status_code}")
-                return None
-            
-            result = response.json()
-            suggestions_text = result.get('response', '').strip()
-            
-            # Parse suggestions (one per line)
-            suggestions = [s.strip() for s in suggestions_text.split('\n') if s.strip()]
-            
-            # Filter and clean suggestions
-            clean_suggestions = []
-            for suggestion in suggestions:
-                # Remove any numbering or bullets
-                suggestion = suggestion.strip()
-                if suggestion and not suggestion.startswith(('1.', '2.', '3.', '4.', '5.', '-', '*')):
-                    if ':' in suggestion:  # Only keep valid commit messages
-                        clean_suggestions.append(suggestion)
-                elif ':' in suggestion:
-                    # Remove numbering if present
-                    if suggestion[0].isdigit():
-                        suggestion = suggestion.split(' ', 1)[1] if ' ' in suggestion else suggestion[2:]
-                    clean_suggestions.append(suggestion.strip())
+            clean_suggestions = self._fetch_suggestions(git_changes, DEFAULT_TEMPERATURE)
+            if clean_suggestions:
+                self._store_cached_suggestions(cache_key, clean_suggestions)
             
-            return clean_suggestions[:5]  # Ensure we only return max 5
+            return clean_suggestions
             
         except requests.exceptions.Timeout:
             print("ERROR: LLM request timed out. Please try again.")
@@ -206,8 +357,104 @@ docs: improve README content structure"""
             print(f"ERROR: Error getting LLM suggestions: {e}")
             return None
     
-    def display_suggestions(self, suggestions):
-        """Display commit suggestions and get user choice."""
+    def _fetch_suggestions(self, git_changes, temperature):
+        """Request suggestions from the LLM; raises on any failure."""
+        prompt = _PROMPT_PREFIX + git_changes + _PROMPT_SUFFIX
+        options = {**_PAYLOAD_TEMPLATE["options"], "temperature": temperature}
+        payload = {**_PAYLOAD_TEMPLATE, "options": options, "model": self.llm_model, "prompt": prompt}
+        
+        response = self.http.post(
+            self.ollama_url, 
+            data=_json_dumps(payload), 
+            headers={"Content-Type": "application/json"},
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"LLM request failed: {response.status_code}")
+        
+        result = _json_loads(response.content)
+        suggestions = _json_loads(result.get('response', '')).get('suggestions', [])
+        
+        # Ensure we only return SUGGESTION_COUNT, stopping as soon as we have them
+        return list(islice(_iter_commit_messages(suggestions), SUGGESTION_COUNT))
+    
+    def _start_alternate_suggestions(self, git_changes):
+        """Generate a more varied set of suggestions while the user is choosing."""
+        future = Future()
+        
+        def generate():
+            try:
+                future.set_result(self._fetch_suggestions(git_changes, ALTERNATE_TEMPERATURE))
+            except Exception as e:
+                future.set_exception(e)
+        
+        # Daemon thread so an unused pass never delays exit
+        threading.Thread(target=generate, daemon=True).start()
+        return future
+    
+    def _suggestions_cache_key(self, git_changes):
+        """Hash the inputs that determine the LLM output."""
+        key_source = f"{self.llm_model}|{PROMPT_VERSION}|{git_changes}"
+        return hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _open_cache(self):
+        """Open (and create if needed) the suggestions cache database."""
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(CACHE_PATH))
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS suggestions "
+            "(hash TEXT PRIMARY KEY, ts INTEGER, suggestions TEXT)"
+        )
+        return conn
+    
+    def _load_cached_suggestions(self, cache_key):
+        """Return cached suggestions for this key, or None on a miss."""
+        try:
+            conn = self._open_cache()
+            try:
+                row = conn.execute(
+                    "SELECT suggestions FROM suggestions WHERE hash = ?", (cache_key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                # Touch the entry so eviction stays least-recently-used
+                conn.execute(
+                    "UPDATE suggestions SET ts = ? WHERE hash = ?", (int(time.time()), cache_key)
+                )
+                conn.commit()
+                return json.loads(row[0])
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+    
+    def _store_cached_suggestions(self, cache_key, suggestions):
+        """Store suggestions and evict stale or least-recently-used entries."""
+        try:
+            conn = self._open_cache()
+            try:
+                now = int(time.time())
+                conn.execute(
+                    "INSERT OR REPLACE INTO suggestions (hash, ts, suggestions) VALUES (?, ?, ?)",
+                    (cache_key, now, json.dumps(suggestions))
+                )
+                conn.execute(
+                    "DELETE FROM suggestions WHERE ts < ?", (now - CACHE_MAX_AGE_DAYS * 86400,)
+                )
+                conn.execute(
+                    "DELETE FROM suggestions WHERE hash NOT IN "
+                    "(SELECT hash FROM suggestions ORDER BY ts DESC LIMIT ?)",
+                    (CACHE_MAX_ENTRIES,)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError):
+            pass
+    
+    def display_suggestions(self, suggestions, allow_regenerate=False):
+        """Display commit suggestions and get user choice (or REGENERATE)."""
         if not suggestions:
             print("ERROR: No valid suggestions received from LLM")
             return None
@@ -220,6 +467,8 @@ docs: improve README content structure"""
         for i, suggestion in enumerate(suggestions, 1):
             print(f"{i}. {suggestion}")
         
+        if allow_regenerate:
+            print("r. Show different suggestions")
         print("0. Cancel (don't commit)")
         print("="*60)
         
@@ -231,6 +480,9 @@ docs: improve README content structure"""
                     print("Commit cancelled")
                     return None
                 
+                if allow_regenerate and choice.lower() == 'r':
+                    return REGENERATE
+                
                 choice_num = int(choice)
                 if 1 <= choice_num <= len(suggestions):
                     return suggestions[choice_num - 1]
@@ -254,22 +506,36 @@ docs: improve README content structure"""
                 print("Commit cancelled")
                 return False
             
-            # Create the commit
-            self.repo.index.commit(message)
+            # Let git write the tree and commit (and run hooks); the staged
+            # set is empty afterwards
+            self._run_git("commit", "-F", "-", "--cleanup=strip", input=message.encode('utf-8'))
+            self._changes_summary = None
             print("Commit created successfully!")
             
             # Show the commit
-            latest_commit = self.repo.head.commit
-            print(f"Commit: {latest_commit.hexsha[:8]} - {message}")
+            short_hash = self._run_git("rev-parse", "--short=8", "HEAD").decode().strip()
+            print(f"Commit: {short_hash} - {message}")
             
             return True
             
+        except subprocess.CalledProcessError as e:
+            details = (e.stderr or e.stdout).decode(errors='replace').strip()
+            print(f"ERROR: Error creating commit: {details}")
+            return False
         except Exception as e:
             print(f"ERROR: Error creating commit: {e}")
             return False
     
     def run(self):
         """Main execution flow."""
+        try:
+            self._run_steps()
+        finally:
+            if self._http is not None:
+                self._http.close()
+    
+    def _run_steps(self):
+        """Execute the generator steps in order."""
         print("AI-Powered Git Commit Generator")
         print("=" * 50)
         
@@ -278,14 +544,23 @@ docs: improve README content structure"""
         if not self.check_git_repo():
             return
         
-        # Step 2: Check Ollama connection
-        print("Checking Ollama connection...")
-        if not self.check_ollama_connection():
+        # Step 2 & 3: Check Ollama connection and read the diff concurrently;
+        # the repo object is created above so workers only read from it
+        print("Checking Ollama connection and analyzing git changes...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ollama_future = executor.submit(self.check_ollama_connection)
+            diff_future = executor.submit(self._collect_diff_only)
+        
+        if not ollama_future.result():
             return
         
-        # Step 3: Get git changes
-        print("Analyzing git changes...")
-        git_changes = self.get_git_changes()
+        try:
+            changes_summary = diff_future.result()
+        except Exception as e:
+            print(f"ERROR: Error getting git changes: {e}")
+            return
+        
+        git_changes = self._format_git_changes(changes_summary)
         if not git_changes:
             return
         
@@ -297,8 +572,21 @@ docs: improve README content structure"""
         if not suggestions:
             return
         
-        # Step 5: User selection
-        chosen_message = self.display_suggestions(suggestions)
+        # Step 5: User selection; an alternative set is generated in the
+        # background so "show different suggestions" doesn't have to wait
+        alternate = self._start_alternate_suggestions(git_changes)
+        while True:
+            chosen_message = self.display_suggestions(suggestions, allow_regenerate=True)
+            if chosen_message is not REGENERATE:
+                break
+            
+            print("Loading different suggestions...")
+            try:
+                suggestions = alternate.result() or suggestions
+            except Exception as e:
+                print(f"ERROR: Error getting LLM suggestions: {e}")
+            alternate = self._start_alternate_suggestions(git_changes)
+        
         if not chosen_message:
             return
         
@@ -4,6 +4,7 @@ Core functionality for the commit generator.
 
 from .git_ops import GitOperations
 from .llm_client import LLMClient
-from .config import Config
+from .config import Config, CONFIG
+from .cache import SuggestionCache
 
-__all__ = ['GitOperations', 'LLMClient', 'Config'] 
\ No newline at end of file
+__all__ = ['GitOperations', 'LLMClient', 'Config', 'CONFIG', 'SuggestionCache'] 
\ No newline at end of file
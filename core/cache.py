@@ -0,0 +1,98 @@
+"""
+Cache Module
+
+Persistent cache of generated commit suggestions, so re-running on the
+same staged changes doesn't call the LLM again.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import List, Optional
+
+
+# Shares commit_generator.py's cache directory; the file differs because
+# the table layouts do
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser('~'), '.cache', 'git-commit-gen', 'llm-suggestions.sqlite'
+)
+
+
+class SuggestionCache:
+    """SQLite-backed LRU cache mapping a request key to suggestions."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = 1000,
+                 max_age_days: int = 7):
+        """Initialize cache location, size limit and entry age limit."""
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """
+        Look up cached suggestions.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached suggestions or None on a miss (or if the cache is unusable)
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT suggestions FROM suggestions WHERE key = ? AND accessed >= ?",
+                    (key, self._oldest_allowed())
+                ).fetchone()
+                if row is None:
+                    return None
+
+                # Refresh the access time so eviction is least-recently-used
+                conn.execute(
+                    "UPDATE suggestions SET accessed = ? WHERE key = ?", (time.time(), key)
+                )
+                return json.loads(row[0])
+        except (sqlite3.Error, OSError, ValueError):
+            return None
+
+    def put(self, key: str, suggestions: List[str]) -> None:
+        """
+        Store suggestions, evicting stale and least recently used entries.
+
+        Args:
+            key: Cache key
+            suggestions: Suggestions to cache
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO suggestions (key, accessed, suggestions) VALUES (?, ?, ?)",
+                    (key, time.time(), json.dumps(suggestions))
+                )
+                conn.execute(
+                    "DELETE FROM suggestions WHERE accessed < ?", (self._oldest_allowed(),)
+                )
+                conn.execute(
+                    "DELETE FROM suggestions WHERE key NOT IN "
+                    "(SELECT key FROM suggestions ORDER BY accessed DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+        except (sqlite3.Error, OSError):
+            pass
+
+    def _oldest_allowed(self) -> float:
+        """Access time before which entries count as stale."""
+        return time.time() - self.max_age_days * 86400
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating it if needed."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS suggestions "
+            "(key TEXT PRIMARY KEY, accessed REAL, suggestions TEXT)"
+        )
+        return conn
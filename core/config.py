@@ -5,79 +5,126 @@ Centralized configuration for the commit generator.
 """
 
 import os
+from dataclasses import asdict, dataclass
 from typing import Optional
 
 
+# Tokens budgeted per requested suggestion (a quoted message plus JSON
+# punctuation), and the least a configured budget may allow
+TOKENS_PER_SUGGESTION = 40
+MIN_TOKENS_PER_SUGGESTION = 20
+
+
+@dataclass(frozen=True)
 class Config:
     """Configuration settings for the commit generator from AI Model."""
+
+    # Ollama settings
+    ollama_base_url: str = 'http://localhost:11434'
+    llm_model: str = 'llama3.2:latest'
+
+    # LLM generation parameters
+    temperature: float = 0.7
+    top_p: float = 0.9
+    # None derives the budget from max_suggestions
+    num_predict: Optional[int] = None
+    max_suggestions: int = 5
+
+    # Request settings
+    request_timeout: int = 30
+    # Only used by LLMClient.agenerate_many
+    max_parallel_requests: int = 4
+    keep_alive: str = '5m'
+
+    # Git settings
+    default_repo_path: str = '.'
+
+    # UI settings
+    show_confidence: bool = False
+    auto_confirm: bool = False
+    cache_suggestions: bool = True
+
+    def __post_init__(self):
+        """Fill in derived defaults."""
+        if self.num_predict is None:
+            # A truncated JSON array can't be parsed, so leave headroom
+            object.__setattr__(
+                self, 'num_predict', self.max_suggestions * TOKENS_PER_SUGGESTION + 20
+            )
     
-    def __init__(self):
-        """Initialize configuration with defaults and environment overrides."""
-        
-        # Ollama settings
-        self.ollama_base_url = os.getenv('OLLAMA_URL', 'http://localhost:11434')
-        self.llm_model = os.getenv('OLLAMA_MODEL', 'llama3.2:latest')
-        
-        # LLM generation parameters
-        self.temperature = float(os.getenv('LLM_TEMPERATURE', '0.7'))
-        self.top_p = float(os.getenv('LLM_TOP_P', '0.9'))
-        self.max_tokens = int(os.getenv('LLM_MAX_TOKENS', '300'))
-        self.max_suggestions = int(os.getenv('MAX_SUGGESTIONS', '5'))
-        
-        # Request settings
-        self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', '30'))
-        
-        # Git settings
-        self.default_repo_path = os.getenv('DEFAULT_REPO_PATH', '.')
-        
-        # UI settings
-        self.show_confidence = os.getenv('SHOW_CONFIDENCE', 'false').lower() == 'true'
-        self.auto_confirm = os.getenv('AUTO_CONFIRM', 'false').lower() == 'true'
-    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build configuration from defaults and environment overrides."""
+        return cls(
+            ollama_base_url=os.getenv('OLLAMA_URL', cls.ollama_base_url),
+            llm_model=os.getenv('OLLAMA_MODEL', cls.llm_model),
+            temperature=float(os.getenv('LLM_TEMPERATURE', '0.7')),
+            top_p=float(os.getenv('LLM_TOP_P', '0.9')),
+            num_predict=int(os.environ['LLM_NUM_PREDICT']) if os.getenv('LLM_NUM_PREDICT') else None,
+            max_suggestions=int(os.getenv('MAX_SUGGESTIONS', '5')),
+            request_timeout=int(os.getenv('REQUEST_TIMEOUT', '30')),
+            max_parallel_requests=int(os.getenv('LLM_MAX_PARALLEL', '4')),
+            keep_alive=os.getenv('OLLAMA_KEEP_ALIVE', cls.keep_alive),
+            default_repo_path=os.getenv('DEFAULT_REPO_PATH', cls.default_repo_path),
+            show_confidence=os.getenv('SHOW_CONFIDENCE', 'false').lower() == 'true',
+            auto_confirm=os.getenv('AUTO_CONFIRM', 'false').lower() == 'true',
+            cache_suggestions=os.getenv('CACHE_SUGGESTIONS', 'true').lower() == 'true'
+        )
+
     def validate(self) -> tuple[bool, Optional[str]]:
         """
         Validate configuration settings.
-        
+
         Returns:
             Tuple of (is_valid, error_message)
         """
         # Validate temperature range
         if not 0.0 <= self.temperature <= 2.0:
             return False, f"Temperature must be between 0.0 and 2.0, got {self.temperature}"
-        
+
         # Validate top_p range
         if not 0.0 <= self.top_p <= 1.0:
             return False, f"Top_p must be between 0.0 and 1.0, got {self.top_p}"
-        
+
+        # Validate num_predict
+        if not 16 <= self.num_predict <= 2048:
+            return False, f"Num predict must be between 16 and 2048, got {self.num_predict}"
+
         # Validate max_suggestions
         if not 1 <= self.max_suggestions <= 10:
             return False, f"Max suggestions must be between 1 and 10, got {self.max_suggestions}"
         
+        # The token budget must fit the requested number of suggestions
+        min_num_predict = self.max_suggestions * MIN_TOKENS_PER_SUGGESTION
+        if self.num_predict < min_num_predict:
+            return False, (
+                f"Num predict must be at least {min_num_predict} for "
+                f"{self.max_suggestions} suggestions, got {self.num_predict}"
+            )
+
+        # Validate max_parallel_requests
+        if not 1 <= self.max_parallel_requests <= 16:
+            return False, f"Max parallel requests must be between 1 and 16, got {self.max_parallel_requests}"
+
         # Validate timeout
         if self.request_timeout < 1:
             return False, f"Request timeout must be positive, got {self.request_timeout}"
-        
+
         return True, None
-    
+
     def to_dict(self) -> dict:
         """Convert configuration to dictionary."""
-        return {
-            'ollama_base_url': self.ollama_base_url,
-            'llm_model': self.llm_model,
-            'temperature': self.temperature,
-            'top_p': self.top_p,
-            'max_tokens': self.max_tokens,
-            'max_suggestions': self.max_suggestions,
-            'request_timeout': self.request_timeout,
-            'default_repo_path': self.default_repo_path,
-            'show_confidence': self.show_confidence,
-            'auto_confirm': self.auto_confirm
-        }
-    
+        return asdict(self)
+
     def __str__(self) -> str:
         """String representation of configuration."""
         config_dict = self.to_dict()
         lines = []
         for key, value in config_dict.items():
             lines.append(f"{key}: {value}")
-        return "\n".join(lines) 
\ No newline at end of file
+        return "\n".join(lines)
+
+
+# Environment is read once at import; share this instance instead of
+# constructing new Config objects
+CONFIG = Config.from_env()
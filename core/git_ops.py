@@ -7,10 +7,48 @@ Handles all git repository interactions including:
 - Creating commits
 """
 
+import os
+import subprocess
+import threading
+from itertools import chain
+from operator import itemgetter
+
 from git import Repo, InvalidGitRepositoryError
 from typing import Dict, List, Optional
 
 
+# Human readable status indexed by ord() of the git change type letter
+_STATUS_BY_ORD = ['Unknown'] * 128
+for _change_type, _status in (
+    ('A', 'Added'),
+    ('M', 'Modified'),
+    ('D', 'Deleted'),
+    ('R', 'Renamed'),
+    ('C', 'Copied'),
+    ('T', 'Type changed')
+):
+    _STATUS_BY_ORD[ord(_change_type)] = _status
+del _change_type, _status
+
+
+def _status_for(change_type: str) -> str:
+    """Look up the human readable status for a git change type."""
+    if change_type and ord(change_type[0]) < 128:
+        return _STATUS_BY_ORD[ord(change_type[0])]
+    return 'Unknown'
+
+
+# Files treated as documentation by classify_changes; .txt is left out
+# because it also covers requirements.txt and other non-doc files
+_DOC_EXTENSIONS = ('.md', '.rst')
+_DOC_FILENAMES = frozenset(('LICENSE', 'COPYING', 'AUTHORS'))
+
+
+def _is_documentation_file(path: str) -> bool:
+    """Check whether a path is a documentation file."""
+    return path.lower().endswith(_DOC_EXTENSIONS) or os.path.basename(path) in _DOC_FILENAMES
+
+
 class GitOperations:
     """Handles git repository operations."""
     
@@ -18,6 +56,14 @@ class GitOperations:
         """Initialize with repository path."""
         self.repo_path = repo_path
         self._repo = None
+        self._git_dir_cached = None
+        # Index file location: None until resolved, '' if it can't be found
+        self._index_path = None
+        # (index mtime, staged files) from the last status call
+        self._status_cache = None
+        # Lazily started `git cat-file --batch` process for read_blob
+        self._cat_file = None
+        self._cat_file_lock = threading.Lock()
     
     @property
     def repo(self) -> Repo:
@@ -31,25 +77,19 @@ class GitOperations:
     
     def is_git_repository(self) -> bool:
         """Check if current directory is a git repository."""
-        try:
-            self.repo
-            return True
-        except Exception:
-            return False
+        # A stat of .git (a directory, or a file for worktrees/submodules)
+        # is enough here; the full Repo is only opened when needed
+        if self._git_dir_cached is None:
+            git_path = os.path.join(self.repo_path, '.git')
+            self._git_dir_cached = os.path.isdir(git_path) or os.path.isfile(git_path)
+        return self._git_dir_cached
     
     def has_staged_changes(self) -> bool:
         """Check if there are staged changes."""
         try:
-            # Check if repository has any commits
-            try:
-                self.repo.head.commit
-                # Repository has commits, compare against HEAD
-                staged_changes = self.repo.index.diff("HEAD", cached=True)
-            except ValueError:
-                # No commits yet, check staged files directly
-                staged_changes = self.repo.index.diff(None, cached=True)
-            
-            return len(staged_changes) > 0
+            # Fills the status cache, so get_staged_changes needs no second
+            # git call
+            return len(self._status()) > 0
         except Exception:
             return False
     
@@ -61,32 +101,22 @@ class GitOperations:
             Dict with change information or None if no changes
         """
         try:
-            # Check if repository has any commits
-            try:
-                self.repo.head.commit
-                # Repository has commits, compare against HEAD
-                staged_changes = self.repo.index.diff("HEAD", cached=True)
-            except ValueError:
-                # No commits yet, check staged files directly
-                staged_changes = self.repo.index.diff(None, cached=True)
-            
-            if not staged_changes:
+            files = self._status()
+            
+            if not files:
                 return None
             
             changes_data = {
-                'files': [],
-                'total_files': len(staged_changes),
-                'summary': ''
+                'files': files,
+                'total_files': len(files),
+                'summary': '',
+                # Identifies the staged content itself, which the summary
+                # (paths and statuses only) doesn't
+                'content_id': "\n".join(
+                    f"{file_info['object_id']} {file_info['path']}" for file_info in files
+                )
             }
             
-            for change in staged_changes:
-                file_info = {
-                    'path': change.a_path or change.b_path,
-                    'change_type': change.change_type,
-                    'status': self._get_change_status(change.change_type)
-                }
-                changes_data['files'].append(file_info)
-            
             # Create human-readable summary
             changes_data['summary'] = self._create_changes_summary(changes_data['files'])
             
@@ -95,6 +125,88 @@ class GitOperations:
         except Exception as e:
             raise Exception(f"Failed to get staged changes: {str(e)}")
     
+    def _status(self) -> List[Dict]:
+        """
+        Get staged files from one `git status --porcelain=v2` call.
+        
+        The result is cached until the index file changes or a commit is
+        created, so has_staged_changes and get_staged_changes share it.
+        Without a known index mtime the cache is never used.
+        
+        Returns:
+            List of file info dicts for staged changes
+        """
+        index_mtime = self._index_mtime()
+        if (index_mtime is not None and self._status_cache is not None
+                and self._status_cache[0] == index_mtime):
+            return self._status_cache[1]
+        
+        output = self._run_git('status', '--porcelain=v2', '-z', '--untracked-files=no').stdout
+        records = output.decode('utf-8', errors='replace').split('\0')
+        
+        files = []
+        index = 0
+        while index < len(records):
+            record = records[index]
+            index += 1
+            
+            # Ordinary entries start with "1", renames/copies with "2" and are
+            # followed by the original path; unmerged ("u") entries are skipped
+            if record.startswith('1 '):
+                fields = record.split(' ', 8)
+            elif record.startswith('2 '):
+                fields = record.split(' ', 9)
+                index += 1
+            else:
+                continue
+            
+            # XY: X is the staged status, '.' means unchanged in the index
+            change_type = fields[1][0]
+            if change_type == '.':
+                continue
+            
+            files.append({
+                'path': fields[-1],
+                # hI: the staged blob's object name
+                'object_id': fields[7],
+                'change_type': change_type,
+                'status': _status_for(change_type)
+            })
+        
+        # git status may refresh the index, so record its mtime afterwards
+        self._status_cache = (self._index_mtime(), files)
+        return files
+    
+    def _find_index_path(self) -> Optional[str]:
+        """Ask git where the index file is."""
+        # .git is a file in linked worktrees, and repo_path may be a
+        # subdirectory of the working tree, so the path can't be assumed
+        try:
+            result = self._run_git('rev-parse', '--git-path', 'index', check=False)
+        except OSError:
+            return None
+        
+        index_path = result.stdout.decode('utf-8', errors='replace').strip()
+        if result.returncode != 0 or not index_path:
+            return None
+        
+        # Relative paths are relative to repo_path, where git ran
+        return os.path.join(self.repo_path, index_path)
+    
+    def _index_mtime(self) -> Optional[int]:
+        """Get the index file's modification time, if it can be located."""
+        # Resolved on first use so constructing GitOperations stays cheap
+        if self._index_path is None:
+            self._index_path = self._find_index_path() or ''
+        
+        if not self._index_path:
+            return None
+        
+        try:
+            return os.stat(self._index_path).st_mtime_ns
+        except OSError:
+            return None
+    
     def create_commit(self, message: str) -> Dict:
         """
         Create a commit with the given message.
@@ -107,6 +219,7 @@ class GitOperations:
         """
         try:
             commit = self.repo.index.commit(message)
+            self._status_cache = None
             
             return {
                 'hash': commit.hexsha[:8],
@@ -121,42 +234,127 @@ class GitOperations:
     def get_recent_commits(self, count: int = 5) -> List[Dict]:
         """Get recent commit messages for context."""
         try:
+            # Ask git for just the fields we show: records are NUL-separated,
+            # fields within a record are separated by \x1f
+            result = self._run_git(
+                'log', '-z', f'--max-count={count}', '--date=short',
+                '--format=%H%x1f%an%x1f%cd%x1f%B',
+                check=False
+            )
+            # Non-zero exit: e.g. no commits yet
+            if result.returncode != 0:
+                return []
+            
             commits = []
-            for commit in self.repo.iter_commits(max_count=count):
+            for record in result.stdout.decode('utf-8', errors='replace').split('\0'):
+                if not record:
+                    continue
+                sha, author, date, message = record.split('\x1f', 3)
                 commits.append({
-                    'hash': commit.hexsha[:8],
-                    'message': commit.message.strip(),
-                    'author': str(commit.author),
-                    'date': commit.committed_datetime.strftime('%Y-%m-%d')
+                    'hash': sha[:8],
+                    'message': message.strip(),
+                    'author': author,
+                    'date': date
                 })
             return commits
         except Exception:
             return []
     
-    def _get_change_status(self, change_type: str) -> str:
-        """Convert git change type to human readable status."""
-        status_map = {
-            'A': 'Added',
-            'M': 'Modified', 
-            'D': 'Deleted',
-            'R': 'Renamed',
-            'C': 'Copied',
-            'T': 'Type changed'
-        }
-        return status_map.get(change_type, 'Unknown')
+    def classify_changes(self, files: List[Dict]) -> Optional[str]:
+        """
+        Recognize changesets whose commit type is obvious without the LLM.
+        
+        Args:
+            files: File info dicts from get_staged_changes
+            
+        Returns:
+            'docs' if only documentation files changed, 'style' if modified
+            files only differ in trailing whitespace or blank lines, else None
+        """
+        if not files:
+            return None
+        
+        if all(_is_documentation_file(file_info['path']) for file_info in files):
+            return 'docs'
+        
+        # Only ignore whitespace that can't change meaning (indentation can)
+        if all(file_info['change_type'] == 'M' for file_info in files):
+            result = self._run_git(
+                'diff', '--cached', '--quiet',
+                '--ignore-space-at-eol', '--ignore-cr-at-eol', '--ignore-blank-lines',
+                check=False
+            )
+            if result.returncode == 0:
+                return 'style'
+        
+        return None
+    
+    def read_blob(self, spec: str) -> Optional[bytes]:
+        """
+        Read an object's contents through a long-lived `git cat-file --batch`.
+        
+        The child process is started on first use and shared by later
+        calls, avoiding a git exec per file.
+        
+        Args:
+            spec: Object name, e.g. "HEAD:path/to/file" or ":path" for the index
+            
+        Returns:
+            Object contents, or None if the object doesn't exist
+        """
+        with self._cat_file_lock:
+            if self._cat_file is None:
+                self._cat_file = subprocess.Popen(
+                    ['git', '-C', self.repo_path, 'cat-file', '--batch'],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    bufsize=1 << 16
+                )
+            
+            process = self._cat_file
+            process.stdin.write(spec.encode('utf-8') + b'\n')
+            process.stdin.flush()
+            
+            # Header is "<sha> <type> <size>" or "<spec> missing"
+            header = process.stdout.readline()
+            if not header:
+                raise Exception("git cat-file exited unexpectedly")
+            
+            fields = header.split()
+            if fields[-1] in (b'missing', b'ambiguous'):
+                return None
+            
+            content = process.stdout.read(int(fields[2]))
+            process.stdout.read(1)  # trailing newline
+            return content
+    
+    def close(self) -> None:
+        """Stop the background cat-file process, if one was started."""
+        with self._cat_file_lock:
+            if self._cat_file is not None:
+                self._cat_file.stdin.close()
+                self._cat_file.wait()
+                self._cat_file = None
+    
+    def _run_git(self, *args: str, check: bool = True) -> subprocess.CompletedProcess:
+        """Run a git command in the repository, capturing its output."""
+        return subprocess.run(
+            ['git', '-C', self.repo_path, *args],
+            capture_output=True,
+            check=check
+        )
     
     def _create_changes_summary(self, files: List[Dict]) -> str:
         """Create a formatted summary of changes for the LLM."""
-        summary_lines = [
-            f"Git Changes Summary:",
+        header = (
+            "Git Changes Summary:",
             f"Total files changed: {len(files)}",
             "",
             "Files changed:"
-        ]
-        
-        for file_info in files:
-            summary_lines.append(
-                f"- {file_info['path']} ({file_info['status']})"
-            )
+        )
+        path_and_status = itemgetter('path', 'status')
         
-        return "\n".join(summary_lines) 
\ No newline at end of file
+        return "\n".join(chain(
+            header,
+            ("- %s (%s)" % path_and_status(file_info) for file_info in files)
+        ))
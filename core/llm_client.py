@@ -4,9 +4,85 @@ LLM Client Module
 Handles communication with Ollama for generating commit messages.
 """
 
+import asyncio
+import hashlib
+import json
+import re
+import time
 import requests
-from typing import List, Optional, Dict
-from .config import Config
+from requests.adapters import HTTPAdapter
+from contextlib import closing
+from itertools import islice
+from typing import Iterator, List, Literal, Optional, Dict, Tuple
+from .cache import SuggestionCache
+from .config import Config, CONFIG
+
+# orjson decodes Ollama responses faster; it's optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Prompt templates by style; each takes a {git_summary} field and a {count}
+# field before it
+PromptStyle = Literal['strict']
+
+_PROMPT_TEMPLATES: Dict[str, str] = {
+    'strict': """IMPORTANT: Look at these changes and determine the ONE correct commit type, then generate {count} variations of THE SAME TYPE.
+
+{git_summary}
+
+CRITICAL RULES:
+1. If ONLY documentation files changed (README, .md files, comments) → ALL suggestions must be 'docs:'
+2. If ONLY code functionality was added → ALL suggestions must be 'feat:'  
+3. If ONLY bugs were fixed → ALL suggestions must be 'fix:'
+4. If ONLY code was cleaned up → ALL suggestions must be 'refactor:'
+5. If ONLY styling/formatting → ALL suggestions must be 'style:'
+
+DO NOT MIX TYPES! All suggestions must use the SAME commit type.
+
+Format: type(scope): description
+Keep descriptions under 50 characters.
+Only vary the descriptions, NEVER the commit type.
+
+RESPOND WITH ONLY A JSON ARRAY OF COMMIT MESSAGES, ONE PER LINE - NO EXPLANATIONS OR EXTRA TEXT!
+
+WRONG format:
+The correct type is docs because...
+docs: update readme
+fix: improve performance
+
+CORRECT format:
+[
+  "docs: update README with version info",
+  "docs: add version number to documentation",
+  "docs: enhance README header section",
+  "docs: improve README content structure"
+]""",
+}
+
+# Bump whenever a prompt template changes so cached suggestions from the
+# old prompt are not reused
+PROMPT_VERSION = 2
+
+# Templates split around {git_summary} once at import, so building a prompt
+# is a plain concatenation
+_PROMPT_PARTS: Dict[str, Tuple[str, str]] = {
+    style: tuple(template.split('{git_summary}', 1))
+    for style, template in _PROMPT_TEMPLATES.items()
+}
+
+# Seconds a /api/tags response is reused by availability checks
+TAGS_CACHE_TTL = 30.0
+
+# A conventional commit line, optionally numbered ("1. ") or bulleted ("- ")
+_SUGGESTION_RE = re.compile(
+    r'^[ \t]*(?:\d+\.[ \t]+|[-*•][ \t]+)?'
+    r'((?:feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert)(?:\([^)\n]+\))?:[^\n]{8,})$',
+    re.IGNORECASE | re.MULTILINE
+)
 
 
 class LLMClient:
@@ -14,25 +90,66 @@ class LLMClient:
     
     def __init__(self, config: Config = None):
         """Initialize LLM client with configuration."""
-        self.config = config or Config()
+        self.config = config or CONFIG
         self.ollama_url = f"{self.config.ollama_base_url}/api/generate"
         self.model = self.config.llm_model
+        
+        # One pooled keep-alive session for every Ollama call; the pool is
+        # large enough for concurrent agenerate_many requests
+        self._session = requests.Session()
+        self._session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+        
+        # Suggestions from earlier runs on identical input
+        self._cache = SuggestionCache()
+        
+        # (fetched_at, models) from the last /api/tags call
+        self._tags_cache: Optional[Tuple[float, List[Dict]]] = None
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+    
+    def __enter__(self) -> "LLMClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def invalidate_tags_cache(self) -> None:
+        """Forget the cached /api/tags response."""
+        self._tags_cache = None
+    
+    def _fetch_tags(self) -> List[Dict]:
+        """
+        Get installed models from /api/tags, reusing a recent response.
+        
+        Returns:
+            List of model info dicts
+            
+        Raises:
+            requests.exceptions.RequestException: If Ollama can't be reached
+                or responds with an error status
+        """
+        if self._tags_cache is not None:
+            fetched_at, models = self._tags_cache
+            if time.monotonic() - fetched_at < TAGS_CACHE_TTL:
+                return models
+        
+        response = self._session.get(
+            f"{self.config.ollama_base_url}/api/tags",
+            timeout=5
+        )
+        response.raise_for_status()
+        
+        models = _json_loads(response.content).get('models', [])
+        self._tags_cache = (time.monotonic(), models)
+        return models
     
     def is_available(self) -> bool:
         """Check if Ollama is running and model is available."""
         try:
-            # Check if Ollama is running
-            response = requests.get(
-                f"{self.config.ollama_base_url}/api/tags", 
-                timeout=5
-            )
-            
-            if response.status_code != 200:
-                return False
-            
             # Check if our model is available
-            models = response.json().get('models', [])
-            model_names = [model['name'] for model in models]
+            model_names = [model['name'] for model in self._fetch_tags()]
             
             return self.model in model_names
             
@@ -44,99 +161,299 @@ class LLMClient:
     def get_available_models(self) -> List[str]:
         """Get list of available models."""
         try:
-            response = requests.get(
-                f"{self.config.ollama_base_url}/api/tags", 
-                timeout=5
-            )
-            
-            if response.status_code == 200:
-                models = response.json().get('models', [])
-                return [model['name'] for model in models]
-            
+            return [model['name'] for model in self._fetch_tags()]
         except Exception:
-            pass
+            return []
+    
+    def warm_up(self) -> bool:
+        """
+        Load the model into memory ahead of the first real request.
+        
+        An empty prompt makes Ollama load the model without generating,
+        and keep_alive keeps it resident afterwards.
         
-        return []
+        Returns:
+            True if Ollama accepted the request, False otherwise
+        """
+        try:
+            response = self._session.post(
+                self.ollama_url,
+                json={
+                    "model": self.model,
+                    "prompt": "",
+                    "stream": False,
+                    "keep_alive": self.config.keep_alive,
+                    "options": {"num_predict": 1}
+                },
+                timeout=self.config.request_timeout
+            )
+            return response.status_code == 200
+        except Exception:
+            return False
     
-    def generate_commit_suggestions(self, git_summary: str) -> Optional[List[str]]:
+    def generate_commit_suggestions(self, git_summary: str,
+                                    content_id: str = '') -> Optional[List[str]]:
         """
         Generate commit message suggestions based on git changes.
         
+        All suggestions come from a single request that asks for a JSON
+        array, so the prompt is only processed once.
+        
         Args:
             git_summary: Formatted summary of git changes
+            content_id: Identity of the staged content; results are only
+                cached when it is given
             
         Returns:
             List of commit message suggestions or None if failed
         """
-        prompt = self._create_prompt(git_summary)
+        cache_key = self._cache_key(git_summary, content_id)
+        cached = self._cache.get(cache_key) if cache_key else None
+        if cached:
+            return cached
+        
+        suggestions = self._generate_uncached(git_summary)
+        if suggestions and cache_key:
+            self._cache.put(cache_key, suggestions)
+        
+        return suggestions
+    
+    def generate_commit_suggestions_stream(self, git_summary: str,
+                                           content_id: str = '') -> Iterator[str]:
+        """
+        Yield commit message suggestions as the model produces them.
+        
+        Cached suggestions are replayed; fresh ones are cached once the
+        stream has been read to the end, or when it is closed early after
+        max_suggestions were produced. Request failures end the stream.
+        
+        Args:
+            git_summary: Formatted summary of git changes
+            content_id: Identity of the staged content; results are only
+                cached when it is given
+            
+        Yields:
+            Commit message suggestions, without duplicates
+        """
+        cache_key = self._cache_key(git_summary, content_id)
+        cached = self._cache.get(cache_key) if cache_key else None
+        if cached:
+            yield from cached
+            return
         
+        payload = self._build_payload(self._create_prompt(git_summary))
+        suggestions = []
+        finished = False
         try:
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.config.temperature,
-                    "top_p": self.config.top_p,
-                    "max_tokens": self.config.max_tokens
-                }
-            }
+            for suggestion in self._iter_streamed_suggestions(payload):
+                if suggestion not in suggestions:
+                    suggestions.append(suggestion)
+                    yield suggestion
+            finished = True
+        except (requests.exceptions.RequestException, ValueError):
+            return
+        finally:
+            # Callers usually stop reading once they have enough suggestions,
+            # so a full set is cached even if the stream was closed early.
+            # Everything yielded is kept: callers filter invalid ones, and a
+            # replay must filter down to the same set
+            if cache_key and suggestions and (finished or len(suggestions) >= self.config.max_suggestions):
+                self._cache.put(cache_key, suggestions)
+    
+    def _cache_key(self, git_summary: str, content_id: str) -> Optional[str]:
+        """
+        Hash everything that determines the generated suggestions.
+        
+        Returns:
+            Cache key, or None if caching is disabled or the staged
+            content isn't identified
+        """
+        if not (self.config.cache_suggestions and content_id):
+            return None
+        
+        key_source = (
+            f"{PROMPT_VERSION}|{self.model}|{self.config.temperature}|{self.config.top_p}|"
+            f"{self.config.max_suggestions}|{content_id}|{git_summary}"
+        )
+        return hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _generate_uncached(self, git_summary: str) -> Optional[List[str]]:
+        """Generate suggestions from the LLM, bypassing the cache."""
+        suggestions = self._request_suggestions(self._create_prompt(git_summary))
+        
+        # Models sometimes repeat a candidate; keep the first occurrence
+        return list(dict.fromkeys(suggestions)) if suggestions else None
+    
+    def _request_suggestions(self, prompt: str) -> Optional[List[str]]:
+        """
+        Send one generation request and parse its suggestions.
+        
+        The response is streamed and the request is abandoned as soon as
+        enough suggestions have been parsed.
+        
+        Args:
+            prompt: Full prompt text
             
-            response = requests.post(
+        Returns:
+            List of commit message suggestions or None if failed
+        """
+        payload = self._build_payload(prompt)
+        
+        try:
+            return self._stream_suggestions(payload, self.config.max_suggestions)
+        except ValueError:
+            # Malformed stream; retry once without streaming
+            pass
+        except requests.exceptions.Timeout:
+            return None
+        except Exception:
+            return None
+        
+        try:
+            response = self._session.post(
                 self.ollama_url,
-                json=payload,
+                json={**payload, "stream": False},
                 timeout=self.config.request_timeout
             )
             
             if response.status_code != 200:
                 return None
             
-            result = response.json()
+            result = _json_loads(response.content)
             suggestions_text = result.get('response', '').strip()
             
             # Parse and clean suggestions
-            suggestions = self._parse_suggestions(suggestions_text)
-            
-            return suggestions[:self.config.max_suggestions]
+            return self._parse_suggestions(suggestions_text)
             
         except requests.exceptions.Timeout:
             return None
         except Exception:
             return None
     
-    def _create_prompt(self, git_summary: str) -> str:
+    def _build_payload(self, prompt: str) -> Dict:
+        """Build a streaming /api/generate payload from the configuration."""
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.config.keep_alive,
+            "options": {
+                "temperature": self.config.temperature,
+                "top_p": self.config.top_p,
+                "num_predict": self.config.num_predict,
+                "num_ctx": 2048,
+                "stop": ["\n\n"]
+            }
+        }
+    
+    def _stream_suggestions(self, payload: Dict, limit: int) -> Optional[List[str]]:
+        """
+        Stream a generation, stopping once enough suggestions are parsed.
+        
+        Args:
+            payload: Request payload with "stream" enabled
+            limit: Number of suggestions to stop at
+            
+        Returns:
+            List of commit message suggestions or None if the request failed
+            
+        Raises:
+            ValueError: If a streamed chunk isn't valid JSON
+        """
+        try:
+            # Closing the iterator closes the response, which stops reading
+            # the remaining tokens
+            with closing(self._iter_streamed_suggestions(payload)) as suggestions:
+                return list(islice(suggestions, limit))
+        except requests.exceptions.HTTPError:
+            return None
+    
+    def _iter_streamed_suggestions(self, payload: Dict) -> Iterator[str]:
+        """
+        Stream a generation and yield suggestions as their lines complete.
+        
+        Args:
+            payload: Request payload with "stream" enabled
+            
+        Yields:
+            Commit message suggestions in the order generated
+            
+        Raises:
+            requests.exceptions.HTTPError: If Ollama rejects the request
+            ValueError: If a streamed chunk isn't valid JSON
+        """
+        response = self._session.post(
+            self.ollama_url,
+            json=payload,
+            timeout=self.config.request_timeout,
+            stream=True
+        )
+        
+        with closing(response):
+            response.raise_for_status()
+            
+            pending = ''
+            for raw_chunk in response.iter_lines():
+                if not raw_chunk:
+                    continue
+                
+                chunk = _json_loads(raw_chunk)
+                pending += chunk.get('response', '')
+                
+                # Only parse whole lines; keep the partial tail for later
+                complete, _, pending = pending.rpartition('\n')
+                if complete:
+                    yield from self._parse_suggestions(complete)
+                
+                if chunk.get('done'):
+                    break
+        
+        yield from self._parse_suggestions(pending)
+    
+    async def agenerate_commit_suggestions(self, git_summary: str) -> Optional[List[str]]:
+        """
+        Async variant of generate_commit_suggestions.
+        
+        The blocking request runs in a worker thread so several calls can
+        be awaited concurrently.
+        
+        Args:
+            git_summary: Formatted summary of git changes
+            
+        Returns:
+            List of commit message suggestions or None if failed
+        """
+        return await asyncio.to_thread(self.generate_commit_suggestions, git_summary)
+    
+    async def agenerate_many(self, summaries: List[str]) -> List[Optional[List[str]]]:
+        """
+        Generate suggestions for several change summaries concurrently.
+        
+        At most config.max_parallel_requests are in flight at once; Ollama
+        itself serves up to OLLAMA_NUM_PARALLEL and queues the rest.
+        
+        Args:
+            summaries: Formatted summaries of git changes
+            
+        Returns:
+            One result per summary, in order (None for failed requests)
+        """
+        semaphore = asyncio.Semaphore(self.config.max_parallel_requests)
+        
+        async def bounded(summary: str) -> Optional[List[str]]:
+            async with semaphore:
+                return await self.agenerate_commit_suggestions(summary)
+        
+        results = await asyncio.gather(
+            *(bounded(summary) for summary in summaries),
+            return_exceptions=True
+        )
+        return [None if isinstance(result, BaseException) else result for result in results]
+    
+    def _create_prompt(self, git_summary: str, prompt_style: PromptStyle = 'strict') -> str:
         """Create focused prompt for commit message generation."""
-        prompt = f"""IMPORTANT: Look at these changes and determine the ONE correct commit type, then generate 3-4 variations of THE SAME TYPE.
-
-{git_summary}
-
-CRITICAL RULES:
-1. If ONLY documentation files changed (README, .md files, comments) → ALL suggestions must be 'docs:'
-2. If ONLY code functionality was added → ALL suggestions must be 'feat:'  
-3. If ONLY bugs were fixed → ALL suggestions must be 'fix:'
-4. If ONLY code was cleaned up → ALL suggestions must be 'refactor:'
-5. If ONLY styling/formatting → ALL suggestions must be 'style:'
-
-DO NOT MIX TYPES! All suggestions must use the SAME commit type.
-
-Format: type(scope): description
-Keep descriptions under 50 characters.
-Only vary the descriptions, NEVER the commit type.
-
-RESPOND WITH ONLY COMMIT MESSAGES - NO EXPLANATIONS OR EXTRA TEXT!
-
-WRONG format:
-The correct type is docs because...
-docs: update readme
-fix: improve performance
-
-CORRECT format:
-docs: update README with version info
-docs: add version number to documentation  
-docs: enhance README header section
-docs: improve README content structure"""
-
-        return prompt
+        prefix, suffix = _PROMPT_PARTS[prompt_style]
+        return prefix.format(count=self.config.max_suggestions) + git_summary + suffix
     
     def _parse_suggestions(self, response_text: str) -> List[str]:
         """
@@ -148,37 +465,37 @@ docs: improve README content structure"""
         Returns:
             List of cleaned commit messages
         """
-        # Split by lines and filter empty lines
-        lines = [line.strip() for line in response_text.split('\n') if line.strip()]
-        
-        cleaned_suggestions = []
-        
-        for line in lines:
-            # Remove common prefixes (numbering, bullets)
-            cleaned_line = line
+        text = response_text.strip()
+        if text.startswith('['):
+            try:
+                items = _json_loads(text)
+            except ValueError:
+                # Incomplete or malformed array; fall back to line parsing
+                items = None
             
-            # Remove numbering like "1. ", "2. ", etc.
-            if line and line[0].isdigit() and '. ' in line:
-                cleaned_line = line.split('. ', 1)[1]
+            if isinstance(items, list):
+                matches = (_SUGGESTION_RE.match(item.strip()) for item in items if isinstance(item, str))
+                suggestions = [match.group(1).strip() for match in matches if match]
+                return suggestions[:self.config.max_suggestions]
+        
+        suggestions = []
+        for line in response_text.splitlines():
+            line = line.strip()
             
-            # Remove bullet points
-            elif line.startswith(('- ', '* ', '• ')):
-                cleaned_line = line[2:]
+            # An element of a JSON array written one per line: decode the
+            # string so its quotes and escapes are handled by the JSON loader
+            if line.startswith('"'):
+                try:
+                    line = _json_loads(line.rstrip(','))
+                except ValueError:
+                    continue
             
-            # Skip explanatory text (lines without ':' or too generic)
-            if ':' not in cleaned_line:
-                continue
-            if len(cleaned_line) < 10:
-                continue
-            if 'correct format' in cleaned_line.lower():
-                continue
-            if 'commit message' in cleaned_line.lower() and 'format' in cleaned_line.lower():
-                continue
-                
-            # Only keep lines that look like valid commit messages
-            cleaned_suggestions.append(cleaned_line.strip())
+            # The regex strips numbering/bullets and skips explanatory text
+            match = _SUGGESTION_RE.match(line)
+            if match:
+                suggestions.append(match.group(1).strip())
         
-        return cleaned_suggestions
+        return suggestions[:self.config.max_suggestions]
     
     def test_connection(self) -> Dict[str, any]:
         """
@@ -195,20 +512,10 @@ docs: improve README content structure"""
         }
         
         try:
-            # Test basic connection
-            response = requests.get(
-                f"{self.config.ollama_base_url}/api/tags",
-                timeout=5
-            )
-            
-            if response.status_code != 200:
-                status['error'] = f"Ollama responded with status {response.status_code}"
-                return status
-            
+            # Test basic connection and get available models
+            models = self._fetch_tags()
             status['connected'] = True
             
-            # Get available models
-            models = response.json().get('models', [])
             model_names = [model['name'] for model in models]
             status['available_models'] = model_names
             
@@ -218,6 +525,8 @@ docs: improve README content structure"""
             if not status['model_available']:
                 status['error'] = f"Model '{self.model}' not found"
             
+        except requests.exceptions.HTTPError as e:
+            status['error'] = f"Ollama responded with status {e.response.status_code}"
         except requests.exceptions.ConnectionError:
             status['error'] = "Cannot connect to Ollama (is 'ollama serve' running?)"
         except Exception as e:
@@ -5,18 +5,23 @@ AI-Powered Git Commit Generator - Main Application
 Orchestrates all components to provide a seamless commit generation experience.
 """
 
+import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from typing import Optional
 
-# Handle import errors gracefully
-try:
-    from core import GitOperations, LLMClient, Config
-    from ui import UserInterface
-    from utils import validate_commit_message
-except ImportError as e:
-    print(f"ERROR: Import error: {e}")
-    print("Please install requirements: pip install -r requirements.txt")
-    sys.exit(1)
+# ui and utils only use the standard library; core (requests, GitPython)
+# is imported when a CommitGenerator is created
+from ui import UserInterface
+from utils import validate_commit_message
+
+
+USAGE = "Usage: main.py [repo_path]"
+
+# Seconds to wait for the background model warm-up before generating
+WARM_UP_JOIN_TIMEOUT = 0.5
 
 
 class CommitGenerator:
@@ -24,10 +29,19 @@ class CommitGenerator:
     
     def __init__(self, repo_path: str = "."):
         """Initialize the commit generator."""
-        self.config = Config()
+        # Handle import errors gracefully
+        try:
+            from core import GitOperations, LLMClient, CONFIG
+        except ImportError as e:
+            print(f"ERROR: Import error: {e}")
+            print("Please install requirements: pip install -r requirements.txt")
+            sys.exit(1)
+        
+        self.config = CONFIG
         self.git_ops = GitOperations(repo_path)
         self.llm_client = LLMClient(self.config)
         self.ui = UserInterface(self.config)
+        self._warm_up_thread = None
         
         # Validate configuration
         is_valid, error = self.config.validate()
@@ -47,12 +61,19 @@ class CommitGenerator:
                 import traceback
                 traceback.print_exc()
             sys.exit(1)
+        finally:
+            self.llm_client.close()
+            self.git_ops.close()
     
     def _run_workflow(self) -> None:
         """Execute the main workflow steps."""
         # Step 1: Show header and validate environment
         self.ui.show_header()
         
+        # The Ollama health check is network-bound, so run it while the
+        # repository is being validated
+        llm_status = self._start_llm_check()
+        
         # Step 2: Validate git repository
         self.ui.show_step(1, 5, "Validating git repository...")
         if not self._validate_git_repository():
@@ -60,7 +81,7 @@ class CommitGenerator:
         
         # Step 3: Check LLM availability
         self.ui.show_step(2, 5, "Checking AI model availability...")
-        if not self._check_llm_availability():
+        if not self._check_llm_availability(llm_status.result()):
             return
         
         # Step 4: Get and analyze git changes
@@ -79,6 +100,20 @@ class CommitGenerator:
         self.ui.show_step(5, 5, "Processing user selection...")
         self._handle_commit_process(suggestions)
     
+    def _start_llm_check(self) -> Future:
+        """Run the Ollama connection test in the background."""
+        future = Future()
+        
+        def check():
+            try:
+                future.set_result(self.llm_client.test_connection())
+            except Exception as e:
+                future.set_exception(e)
+        
+        # Daemon thread so a failed git check exits without waiting on Ollama
+        threading.Thread(target=check, daemon=True).start()
+        return future
+    
     def _validate_git_repository(self) -> bool:
         """Validate that we're in a git repository with staged changes."""
         if not self.git_ops.is_git_repository():
@@ -96,9 +131,8 @@ class CommitGenerator:
         self.ui.show_success("Git repository validated")
         return True
     
-    def _check_llm_availability(self) -> bool:
-        """Check if LLM is available and ready."""
-        status = self.llm_client.test_connection()
+    def _check_llm_availability(self, status: dict) -> bool:
+        """Check if LLM is available and ready, given its connection status."""
         self.ui.show_llm_status(status)
         
         if not status['connected']:
@@ -111,12 +145,20 @@ class CommitGenerator:
             self.ui.show_info(f"Install the model: ollama pull {self.config.llm_model}")
             return False
         
+        # Load the model while we read the git changes
+        self._warm_up_thread = threading.Thread(target=self.llm_client.warm_up, daemon=True)
+        self._warm_up_thread.start()
         return True
     
     def _get_git_changes(self) -> Optional[dict]:
         """Get and display git changes."""
         try:
-            changes_data = self.git_ops.get_staged_changes()
+            # Both are independent git subprocesses, so run them together
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                staged = executor.submit(self.git_ops.get_staged_changes)
+                recent = executor.submit(self.git_ops.get_recent_commits, 3)
+                changes_data = staged.result()
+                recent_commits = recent.result()
             
             if not changes_data:
                 self.ui.show_error("No staged changes found")
@@ -125,7 +167,6 @@ class CommitGenerator:
             self.ui.show_git_changes(changes_data)
             
             # Show recent commits for context
-            recent_commits = self.git_ops.get_recent_commits(3)
             if recent_commits:
                 self.ui.show_recent_commits(recent_commits)
             
@@ -137,12 +178,40 @@ class CommitGenerator:
     
     def _generate_suggestions(self, changes_data: dict) -> Optional[list]:
         """Generate commit message suggestions using LLM."""
+        # Obvious docs/style changes don't need the model at all
+        rule_suggestions = self._rule_based_suggestions(changes_data)
+        if rule_suggestions:
+            self.ui.show_success(f"Generated {len(rule_suggestions)} commit suggestions (no AI needed)")
+            return rule_suggestions
+        
         self.ui.show_generating_message()
         
+        # Give the warm-up a moment to finish; the real request will wait
+        # for the model load anyway if it hasn't
+        if self._warm_up_thread is not None:
+            self._warm_up_thread.join(timeout=WARM_UP_JOIN_TIMEOUT)
+        
         try:
-            suggestions = self.llm_client.generate_commit_suggestions(changes_data['summary'])
+            # Validate suggestions as they stream in and stop reading once
+            # there are enough valid ones
+            received = 0
+            validated_suggestions = []
+            stream = self.llm_client.generate_commit_suggestions_stream(
+                changes_data['summary'], changes_data['content_id']
+            )
+            with closing(stream):
+                for suggestion in stream:
+                    received += 1
+                    is_valid, error = validate_commit_message(suggestion)
+                    if not is_valid:
+                        self.ui.show_debug(f"Invalid suggestion filtered: {suggestion} ({error})")
+                        continue
+                    
+                    validated_suggestions.append(suggestion)
+                    if len(validated_suggestions) >= self.config.max_suggestions:
+                        break
             
-            if not suggestions:
+            if not received:
                 self.ui.show_error("Failed to generate commit suggestions")
                 self.ui.show_info("This could be due to:")
                 self.ui.show_info("  - LLM request timeout")
@@ -150,15 +219,6 @@ class CommitGenerator:
                 self.ui.show_info("  - Network connectivity issues")
                 return None
             
-            # Validate generated suggestions
-            validated_suggestions = []
-            for suggestion in suggestions:
-                is_valid, error = validate_commit_message(suggestion)
-                if is_valid:
-                    validated_suggestions.append(suggestion)
-                else:
-                    self.ui.show_debug(f"Invalid suggestion filtered: {suggestion} ({error})")
-            
             if not validated_suggestions:
                 self.ui.show_error("No valid commit suggestions generated")
                 return None
@@ -170,6 +230,30 @@ class CommitGenerator:
             self.ui.show_error(f"Failed to generate suggestions: {str(e)}")
             return None
     
+    def _rule_based_suggestions(self, changes_data: dict) -> Optional[list]:
+        """Build suggestions for changesets with an obvious commit type."""
+        commit_type = self.git_ops.classify_changes(changes_data['files'])
+        if not commit_type:
+            return None
+        
+        files = changes_data['files']
+        name = os.path.basename(files[0]['path'])
+        
+        if commit_type == 'docs':
+            if len(files) == 1:
+                verb = {'Added': 'add', 'Deleted': 'remove'}.get(files[0]['status'], 'update')
+                candidates = [f"docs: {verb} {name}", "docs: update documentation"]
+            else:
+                candidates = ["docs: update documentation", f"docs: update {len(files)} documentation files"]
+        else:
+            if len(files) == 1:
+                candidates = [f"style: clean up whitespace in {name}", "style: clean up whitespace"]
+            else:
+                candidates = ["style: clean up whitespace", "style: remove trailing whitespace"]
+        
+        # Long file names can push a candidate past the length limit
+        return [message for message in candidates if validate_commit_message(message)[0]]
+    
     def _handle_commit_process(self, suggestions: list) -> None:
         """Handle user selection and commit creation."""
         # Display suggestions and get user choice
@@ -206,6 +290,9 @@ def main():
     # Parse command line arguments (if any)
     repo_path = "."
     if len(sys.argv) > 1:
+        if sys.argv[1] in ('-h', '--help'):
+            print(USAGE)
+            return
         repo_path = sys.argv[1]
     
     # Create and run the commit generator
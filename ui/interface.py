@@ -11,6 +11,22 @@ from typing import List, Optional, Dict
 import sys
 
 
+# Panel separators
+_HEADER_RULE = "=" * 50
+_SUGGESTIONS_RULE = "=" * 60
+_CHANGES_RULE = "-" * 30
+_COMMITS_RULE = "-" * 40
+
+_STATUS_INDICATORS = {
+    'Added': '[+]',
+    'Modified': '[M]',
+    'Deleted': '[D]',
+    'Renamed': '[R]',
+    'Copied': '[C]',
+    'Type changed': '[T]'
+}
+
+
 class UserInterface:
     """Handles user interface interactions."""
     
@@ -22,7 +38,7 @@ class UserInterface:
     def show_header(self):
         """Display application header."""
         print("AI-Powered Git Commit Generator")
-        print("=" * 50)
+        print(_HEADER_RULE)
     
     def show_step(self, step: int, total: int, message: str):
         """Display step progress."""
@@ -52,15 +68,14 @@ class UserInterface:
     
     def show_git_changes(self, changes_data: Dict):
         """Display git changes information."""
-        print("\nFound staged changes:")
-        print("-" * 30)
+        lines = ["", "Found staged changes:", _CHANGES_RULE]
         
         for file_info in changes_data['files']:
-            status_emoji = self._get_status_indicator(file_info['status'])
-            print(f"{status_emoji} {file_info['path']} ({file_info['status']})")
+            status = file_info['status']
+            lines.append(f"{_STATUS_INDICATORS.get(status, '[?]')} {file_info['path']} ({status})")
         
-        print(f"\nTotal files: {changes_data['total_files']}")
-        print("-" * 30)
+        lines += ["", f"Total files: {changes_data['total_files']}", _CHANGES_RULE]
+        self._write_lines(lines)
     
     def show_llm_status(self, status: Dict):
         """Display LLM connection status."""
@@ -92,15 +107,14 @@ class UserInterface:
             self.show_error("No valid suggestions received")
             return None
         
-        print("\n" + "=" * 60)
-        print("Generated Commit Message Suggestions:")
-        print("=" * 60)
+        lines = ["", _SUGGESTIONS_RULE, "Generated Commit Message Suggestions:", _SUGGESTIONS_RULE]
+        lines += [f"{i}. {suggestion}" for i, suggestion in enumerate(suggestions, 1)]
+        lines += ["0. Cancel (don't commit)", _SUGGESTIONS_RULE]
+        self._write_lines(lines)
         
-        for i, suggestion in enumerate(suggestions, 1):
-            print(f"{i}. {suggestion}")
-        
-        print("0. Cancel (don't commit)")
-        print("=" * 60)
+        if self.config and self.config.auto_confirm:
+            print("Auto-confirm enabled: selecting suggestion 1")
+            return "1"
         
         return self._get_user_choice(len(suggestions))
     
@@ -133,17 +147,17 @@ class UserInterface:
             print(f"Timestamp: {commit_info['timestamp']}")
     
     def show_recent_commits(self, commits: List[Dict]):
-        """Display recent commits for context."""
+        """Display recent commits for context; callers pass only the commits to show."""
         if not commits:
             return
         
-        print("\nRecent commits (for context):")
-        print("-" * 40)
-        
-        for commit in commits[:3]:  # Show only last 3
-            print(f"{commit['hash']} - {commit['message'][:50]}...")
-        
-        print("-" * 40)
+        lines = ["", "Recent commits (for context):", _COMMITS_RULE]
+        lines += [
+            f"{commit['hash']} - {commit['message'][:50]}..."
+            for commit in commits
+        ]
+        lines.append(_COMMITS_RULE)
+        self._write_lines(lines)
     
     def ask_yes_no(self, question: str, default: bool = False) -> bool:
         """
@@ -174,36 +188,27 @@ class UserInterface:
         while True:
             try:
                 choice_input = input(f"\nChoose a commit message (0-{max_choice}): ").strip()
-                
-                if choice_input == '0':
-                    self.show_info("Commit cancelled")
-                    return None
-                
-                try:
-                    choice_num = int(choice_input)
-                    if 1 <= choice_num <= max_choice:
-                        # We need to return the actual suggestion, but we don't have access to it here
-                        # This will be handled by the caller
-                        return choice_input
-                    else:
-                        self.show_error(f"Please enter a number between 0 and {max_choice}")
-                except ValueError:
-                    self.show_error("Please enter a valid number")
-                    
             except KeyboardInterrupt:
                 self.handle_keyboard_interrupt()
             except EOFError:
                 print("\nOperation cancelled")
                 return None
+            
+            if not choice_input.isdecimal():
+                self.show_error("Please enter a valid number")
+                continue
+            
+            choice_num = int(choice_input)
+            if choice_num == 0:
+                self.show_info("Commit cancelled")
+                return None
+            
+            if choice_num <= max_choice:
+                # The caller maps the number back to its suggestion
+                return str(choice_num)
+            
+            self.show_error(f"Please enter a number between 0 and {max_choice}")
     
-    def _get_status_indicator(self, status: str) -> str:
-        """Get text indicator for file status."""
-        indicator_map = {
-            'Added': '[+]',
-            'Modified': '[M]', 
-            'Deleted': '[D]',
-            'Renamed': '[R]',
-            'Copied': '[C]',
-            'Type changed': '[T]'
-        }
-        return indicator_map.get(status, '[?]') 
\ No newline at end of file
+    def _write_lines(self, lines: List[str]):
+        """Write a block of lines to stdout in a single call."""
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -2,6 +2,6 @@
 Utility functions for the commit generator.
 """
 
-from .helpers import validate_commit_message, format_commit_message
+from .helpers import validate_commit_message, validate_many, format_commit_message
 
-__all__ = ['validate_commit_message', 'format_commit_message'] 
\ No newline at end of file
+__all__ = ['validate_commit_message', 'validate_many', 'format_commit_message'] 
\ No newline at end of file
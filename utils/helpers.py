@@ -4,8 +4,63 @@ Helper Functions
 Utility functions for various operations.
 """
 
-import re
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+_TYPES = frozenset({
+    'feat', 'fix', 'docs', 'style', 'refactor', 'test',
+    'chore', 'perf', 'ci', 'build', 'revert'
+})
+
+
+_CONVENTIONAL_TYPES = tuple(MappingProxyType(entry) for entry in (
+    {'type': 'feat', 'description': 'A new feature'},
+    {'type': 'fix', 'description': 'A bug fix'},
+    {'type': 'docs', 'description': 'Documentation only changes'},
+    {'type': 'style', 'description': 'Changes that do not affect the meaning of the code'},
+    {'type': 'refactor', 'description': 'A code change that neither fixes a bug nor adds a feature'},
+    {'type': 'test', 'description': 'Adding missing tests or correcting existing tests'},
+    {'type': 'chore', 'description': 'Changes to the build process or auxiliary tools'},
+    {'type': 'perf', 'description': 'A code change that improves performance'},
+    {'type': 'ci', 'description': 'Changes to CI configuration files and scripts'},
+    {'type': 'build', 'description': 'Changes that affect the build system or external dependencies'},
+    {'type': 'revert', 'description': 'Reverts a previous commit'}
+))
+
+
+# Characters not allowed in filenames on common platforms
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _split_conventional(message: str) -> Optional[Tuple[str, Optional[str], str]]:
+    """
+    Split a message into type, scope and description without a regex.
+    
+    Args:
+        message: Commit message to split
+        
+    Returns:
+        Tuple of (type, scope, description), or None if not conventional
+    """
+    head, sep, description = message.partition(': ')
+    if not sep or not description:
+        return None
+    
+    commit_type, paren, scope = head.partition('(')
+    if commit_type not in _TYPES:
+        return None
+    
+    if not paren:
+        return commit_type, None, description
+    
+    # A scope must be non-empty and closed right before the colon
+    if len(scope) < 2 or scope[-1] != ')':
+        return None
+    
+    return commit_type, scope[:-1], description
 
 
 def validate_commit_message(message: str) -> Tuple[bool, Optional[str]]:
@@ -18,29 +73,41 @@ def validate_commit_message(message: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not message or not message.strip():
+    if not message:
         return False, "Commit message cannot be empty"
     
-    # Basic conventional commit pattern
-    pattern = r'^(feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert)(\(.+\))?: .+'
-    
-    if not re.match(pattern, message):
-        return False, "Message doesn't follow conventional commit format: type(scope): description"
-    
-    # Check length
+    # Check length first; it rejects overlong messages without parsing them
     if len(message) > 72:
         return False, f"Message too long ({len(message)} chars). Keep under 72 characters."
     
-    # Check if description starts with lowercase
-    colon_pos = message.find(': ')
-    if colon_pos != -1 and colon_pos + 2 < len(message):
-        description = message[colon_pos + 2:]
-        if description[0].isupper():
-            return False, "Description should start with lowercase letter"
+    if not message.strip():
+        return False, "Commit message cannot be empty"
+    
+    parts = _split_conventional(message)
+    if parts is None:
+        return False, "Message doesn't follow conventional commit format: type(scope): description"
+    
+    # Check if description starts with lowercase; the split already
+    # guarantees a non-empty description
+    if 'A' <= parts[2][0] <= 'Z':
+        return False, "Description should start with lowercase letter"
     
     return True, None
 
 
+def validate_many(messages: Iterable[str]) -> List[Tuple[str, bool, Optional[str]]]:
+    """
+    Validate several commit messages in one pass.
+    
+    Args:
+        messages: Commit messages to validate
+        
+    Returns:
+        List of (message, is_valid, error_message) tuples in input order
+    """
+    return [(message, *validate_commit_message(message)) for message in messages]
+
+
 def format_commit_message(commit_type: str, scope: Optional[str], description: str) -> str:
     """
     Format a commit message following conventional commit format.
@@ -67,43 +134,31 @@ def extract_commit_info(message: str) -> Dict[str, Optional[str]]:
     Returns:
         Dict with type, scope, description
     """
-    pattern = r'^(feat|fix|docs|style|refactor|test|chore|perf|ci|build|revert)(\((.+)\))?: (.+)'
-    match = re.match(pattern, message)
+    parts = _split_conventional(message)
     
-    if not match:
+    if parts is None:
         return {
             'type': None,
             'scope': None,
             'description': message
         }
     
+    commit_type, scope, description = parts
     return {
-        'type': match.group(1),
-        'scope': match.group(3),
-        'description': match.group(4)
+        'type': commit_type,
+        'scope': scope,
+        'description': description
     }
 
 
-def get_conventional_types() -> List[Dict[str, str]]:
+def get_conventional_types() -> Tuple[Mapping[str, str], ...]:
     """
-    Get list of conventional commit types with descriptions.
+    Get conventional commit types with descriptions.
     
     Returns:
-        List of dicts with type and description
-    """
-    return [
-        {'type': 'feat', 'description': 'A new feature'},
-        {'type': 'fix', 'description': 'A bug fix'},
-        {'type': 'docs', 'description': 'Documentation only changes'},
-        {'type': 'style', 'description': 'Changes that do not affect the meaning of the code'},
-        {'type': 'refactor', 'description': 'A code change that neither fixes a bug nor adds a feature'},
-        {'type': 'test', 'description': 'Adding missing tests or correcting existing tests'},
-        {'type': 'chore', 'description': 'Changes to the build process or auxiliary tools'},
-        {'type': 'perf', 'description': 'A code change that improves performance'},
-        {'type': 'ci', 'description': 'Changes to CI configuration files and scripts'},
-        {'type': 'build', 'description': 'Changes that affect the build system or external dependencies'},
-        {'type': 'revert', 'description': 'Reverts a previous commit'}
-    ]
+        Read-only tuple of mappings with type and description
+    """
+    return _CONVENTIONAL_TYPES
 
 
 def sanitize_filename(filename: str) -> str:
@@ -116,10 +171,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    # Remove leading/trailing spaces and dots
-    sanitized = sanitized.strip(' .')
+    # Replace invalid characters, then remove leading/trailing spaces and dots
+    sanitized = filename.translate(_SANITIZE_TABLE).strip(' .')
     # Limit length
     if len(sanitized) > 255:
         sanitized = sanitized[:255]
@@ -159,4 +212,8 @@ def parse_environment_bool(value: str, default: bool = False) -> bool:
     if not value:
         return default
     
-    return value.lower() in ['true', '1', 'yes', 'on'] 
\ No newline at end of file
+    # Most values are already lowercase; skip the copy for those
+    if value in _TRUE_VALUES:
+        return True
+    
+    return value.lower() in _TRUE_VALUES 
\ No newline at end of file